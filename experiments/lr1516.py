@@ -1,6 +1,5 @@
 import logging
 
-from ophyd.sim import SynAxis
 from pcdsdevices.epics_motor import Newport
 from pcdsdaq.daq import Daq
 
@@ -23,8 +22,8 @@ class User(object):
     # Devices
     vitara = Vitara("LAS:FS2:VIT", name="Vitara")
     delay = Newport("SXR:LAS:H1:DLS:01", name="Delay Stage")
-    syn_motor_1 = SynAxis(name="Syn Motor 1")
     daq = Daq(platform=0)
+    _syn_motor_1 = None
 
     def __init__(self, *args, **kwargs):
         # If this is ever tested, remove the following line and update the 
@@ -32,6 +31,14 @@ class User(object):
         logger.warning("Functionality not tested with sxrpython, use with "
                        "caution!")
 
+    @property
+    def syn_motor_1(self):
+        """Simulated motor, only created the first time it is used."""
+        if self._syn_motor_1 is None:
+            from ophyd.sim import SynAxis
+            self._syn_motor_1 = SynAxis(name="Syn Motor 1")
+        return self._syn_motor_1
+
     def delay_scan(self, start, stop, num=None, step_size=None, 
                    events_per_point=1000, record=True, controls=None, wait=None,
                    return_to_start=True, delay_const=1):
@@ -1,11 +1,12 @@
 import IPython
 import logging
+import numbers
 import time
 import os
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from functools import reduce
-from glob import glob
-from inspect import getdoc, getframeinfo, currentframe
+from inspect import getdoc
 
 import json
 import numpy as np
@@ -22,6 +23,29 @@ from .utils import calibrated
 
 logger = logging.getLogger(__name__)
 
+# Valid responses to the yes/no prompts
+_YN = frozenset(('y', 'n'))
+
+
+def _uniform_chip_from_i(first_dim, dim, num_dims, i):
+    """Returns the chip number of column i for a palette where every chip after
+    the first is `dim` columns wide."""
+    if i < first_dim:
+        return 0
+    return min(1 + (i - first_dim)//dim, num_dims)
+
+
+def _sample_number(k):
+    """Returns sample number k as an int, raising InvalidSampleError if it
+    isn't a whole number."""
+    try:
+        if k == int(k):
+            return int(k)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    raise InvalidSampleError('Sample numbers must be integers, but got '
+                             '{0}'.format(k))
+
 
 class McgranePalette(Device, FltMvInterface):
     x_motor = Cpt(ErrorIMS, "SXR:EXP:MMS:08", name='LJE Sample X')
@@ -69,33 +93,58 @@ class McgranePalette(Device, FltMvInterface):
         self.M = M
 
         self.chip_dims = chip_dims
+        # Index of the first column of the next chip, used for vectorized chip
+        # lookups
+        self._chip_cumsum = np.cumsum(np.asarray(self.chip_dims,
+                                                 dtype=np.int64))
         # Make sure the dimensions passed match N
-        if self.N != sum(self.chip_dims):
+        if self.N != int(self._chip_cumsum[-1]):
             raise InputError('Inputted differing number of samples in M as the '
                              'number of samples in the chip dimensions. Got '
                              '{0} and {1} (sum {2}).'.format(
-                                 self.N, self.chip_dims, sum(self.chip_dims)))
+                                 self.N, self.chip_dims,
+                                 int(self._chip_cumsum[-1])))
         # Percent of the sample traversed at each chip. This will be used to
         # perform the chip readback
-        self.chip_dims_percents = [sum(self.chip_dims[:i+1]) / self.N
-                                   for i in range(len(self.chip_dims))]
+        self.chip_dims_percents = self._chip_cumsum / self.N
         # Sample spacings
         self.chip_spacing = chip_spacing
         self.sample_spacing = sample_spacing
         # Number of chips, zero indexed
         self.num_chips = len(self.chip_dims) - 1
+        # When every chip after the first is the same size, as in the default
+        # layout, the chip of a column can be computed directly
+        first_dim, other_dims = self.chip_dims[0], self.chip_dims[1:]
+        if other_dims and all(dim == other_dims[0] for dim in other_dims):
+            self._chip_from_i = partial(_uniform_chip_from_i, first_dim,
+                                        other_dims[0], len(self.chip_dims))
         # Calculate the length of the palette in mm
-        self.length = ((self.N - self.num_chips - 1)*self.sample_spacing 
-                       + self.num_chips * self.chip_spacing)
+        length = ((self.N - self.num_chips - 1)*self.sample_spacing
+                  + self.num_chips * self.chip_spacing)
         # Percent of each extra chip spacing of the total length
-        self.chip_factor = (self.chip_spacing - self.sample_spacing)/self.length
+        self.chip_factor = (self.chip_spacing - self.sample_spacing)/length
 
         # Total number of samples
         self.samples = self.N * self.M
+        # (i,j) index of every sample along the snaking path
+        self._k_to_ij = np.ascontiguousarray(
+            self.locate_1d_batch(np.arange(self.samples)), dtype=np.int32)
+        # ...and the sample number of every (i,j) index
+        self._ij_to_k = np.empty((self.N, self.M), dtype=np.int32)
+        self._ij_to_k[self._k_to_ij[:, 0], self._k_to_ij[:, 1]] = np.arange(
+            self.samples)
+        # Chip number of every sample column
+        self._chip_per_i = self._chip_from_i_array(np.arange(self.N))
         # This will be convenient
         self.motors = [self.x_motor, self.y_motor, self.z_motor]
-        # Create a list of the different move functions we could use
-        self.move_funcs = [self.move_1d, self.move_2d, self.move_3d]
+        # Coordinates held by cached_coordinates
+        self._cached_coords = None
+        # Last commanded coordinates and the readback tolerance used to skip
+        # moves to where the palette already is
+        self._last_cmd = np.full(len(self.motors), np.nan)
+        self.move_tolerance = 1e-3
+        # Move functions indexed by the number of arguments they take
+        self._dispatch = (None, self.move_1d, self.move_2d, self.move_3d)
 
         # Calibration attributes
         self.start_pt = None
@@ -106,6 +155,14 @@ class McgranePalette(Device, FltMvInterface):
         self.M_hat = None
         self.NM_hat = None
         self.length_calibrated = None
+        self._inv_length_calibrated = None
+        self._NM_hatT = None
+        self._chip_correction = None
+        self._n_vec = None
+        self._chip_vec = None
+        self._chip_vec_per_i = None
+        self._k_to_xyz = None
+        self._ij_to_xyz = None
         # Internal indicator for whether there is a calibration
         self.calibrated = False
 
@@ -118,10 +175,11 @@ class McgranePalette(Device, FltMvInterface):
     def save_calibration(self, name=None):
         """Save the current calibration to the calibration folder.
 
-        If there is a calibration being used, this method saves it in a json
+        If there is a calibration being used, this method saves it in a npy
         file in the calibration folder, using the inputted name or a default
-        one. It will raise an error if this method is called when the motor is
-        not calibrated.
+        one. Names ending in .json are saved in the older json format. It will
+        raise an error if this method is called when the motor is not
+        calibrated.
 
         Parameters
         ----------
@@ -134,7 +192,7 @@ class McgranePalette(Device, FltMvInterface):
             If this method is called but the motor is not using a calibration
         """ 
         # Create the calibration file
-        name = name or 'calibration_{0}.json'.format(
+        name = name or 'calibration_{0}.npy'.format(
             time.strftime("%Y%m%d_%H%M%S"))
         calib_path = self.dir_calib / name
         # Make the file if it doesn't exist 
@@ -142,16 +200,23 @@ class McgranePalette(Device, FltMvInterface):
             calib_path.touch()
             calib_path.chmod(0o777)
         
-        # Write the calibration coordinates
-        with open(str(calib_path), 'w') as calib:
-            json.dump([list(pt) for pt in self.calibration_coordinates], calib)
+        # Write the calibration coordinates as a (3,3) array, keeping json for
+        # names that ask for it
+        calibration = np.stack(self.calibration_coordinates)
+        if calib_path.suffix == '.json':
+            with open(str(calib_path), 'w') as calib:
+                json.dump(calibration.tolist(), calib)
+        else:
+            with open(str(calib_path), 'wb') as calib:
+                np.save(calib, calibration)
         logger.info('Saved calibration as "{0}"'.format(name))
 
     def load_calibration(self, name=None, confirm_overwrite=True):
         """Load a palette calibration from a file.
         
-        From the calibration directory, load a calibration json file to use for
-        sample motion. If no name is inputted, the most recently modified file
+        From the calibration directory, load a calibration file to use for
+        sample motion. Files are read as npy arrays, except for older json
+        calibrations. If no name is inputted, the most recently modified file
         is loaded.
 
         Parameters
@@ -164,8 +229,12 @@ class McgranePalette(Device, FltMvInterface):
         """
         if not name:
             # Grab the most recent file if a name wasn't passed
-            calib_path = Path(max(glob(str(self.dir_calib / '*')), 
-                                  key=os.path.getctime))
+            with os.scandir(str(self.dir_calib)) as entries:
+                calib_path = Path(max((entry for entry in entries
+                                       if entry.is_file()
+                                       and not entry.name.startswith('.')),
+                                      key=lambda entry: entry.stat().st_ctime
+                                      ).path)
         else:
             # Make sure the file exists before proceeding
             calib_path = self.dir_calib / name
@@ -175,8 +244,14 @@ class McgranePalette(Device, FltMvInterface):
 
         # Load the calibration file
         logger.info('Loading calibration from "{0}"'.format(calib_path.name))
-        with open(str(calib_path), 'r') as calib:
-            calibration_coordinates = [np.array(pt) for pt in json.load(calib)]
+        try:
+            calibration_coordinates = np.load(str(calib_path))
+        except (ValueError, OSError):
+            # Older calibrations are json files, whatever their names are
+            with open(str(calib_path), 'r') as calib:
+                # Read the three points into a single (3,3) float block
+                calibration_coordinates = np.array(json.load(calib),
+                                                   dtype=np.float64)
 
         # Accept the calibration
         self._accept_calibration(*calibration_coordinates,
@@ -206,12 +281,24 @@ class McgranePalette(Device, FltMvInterface):
             3-length iterable (x,y,z) specifying spatial coordinate if the [0,M]
             sample
         """
+        # Store the points as plain contiguous float arrays so none of the math
+        # below goes through pandas
+        start_pt = np.ascontiguousarray(start_pt, dtype=np.float64)
+        n_pt = np.ascontiguousarray(n_pt, dtype=np.float64)
+        m_pt = np.ascontiguousarray(m_pt, dtype=np.float64)
+        # Points that coincide with the start leave no sample spacing to
+        # interpolate the palette from
+        if not np.any(n_pt - start_pt) or not np.any(m_pt - start_pt):
+            raise InputError('The [N,0] and [0,M] points must differ from the '
+                             '[0,0] point, got {0}, {1} and {2}'.format(
+                                 list(start_pt), list(n_pt), list(m_pt)))
+
         if self.calibrated and confirm_overwrite:
             # Get input from the user if they really want to calibrate
             prompt_str = 'Are you sure you want to overwrite the current ' \
               'calibration ([y]/n)? '
             response = input(prompt_str)
-            while response.lower() not in set(['y', 'n']):
+            while response.lower() not in _YN:
                 # Keep probing until they enter y or n
                 response = input('Invalid input "{0}". ' + prompt_str) 
                 # If they are happy with the position, move on to the next point
@@ -219,19 +306,21 @@ class McgranePalette(Device, FltMvInterface):
                 logger.info('Canceling calibration.')
                 return
         
-        self.calibrated = True
+        # Only flag the palette as calibrated once everything below is built
+        self.calibrated = False
         # save the origin point in XYZ space
         self.start_pt = start_pt
         self.n_pt = n_pt
         self.m_pt = m_pt
         self.calibration_coordinates = [self.start_pt, self.n_pt, self.m_pt]
+        # Vector between the [0,0] and [N,0] samples
+        self._n_vec = self.n_pt - self.start_pt
 
         # Define the N sample spacing by finding the vector between the [0,0]
         # point and the [N,0] point, then scale it by the theoretical distance 
         # betwen them if the chip spacing was the same length as the sample
         # spacing, and then divide by the number of samples in N
-        self.N_hat = (((self.n_pt - self.start_pt) 
-                       * (1 - self.num_chips*self.chip_factor))
+        self.N_hat = ((self._n_vec * (1 - self.num_chips*self.chip_factor))
                       / (self.N - 1))
 
         # Define the M sample spacing by finding the vector between teh [0,0]
@@ -240,12 +329,38 @@ class McgranePalette(Device, FltMvInterface):
         self.M_hat = (self.m_pt - self.start_pt) / (self.M - 1)
 
         # Put both N_hat and M_hat in an array for future use
-        self.NM_hat = np.concatenate((self.N_hat.reshape(len(self.motors), 1), 
-                                      self.M_hat.reshape(len(self.motors), 1)), 
-                                     axis=1)
+        self.NM_hat = np.column_stack((self.N_hat, self.M_hat))
+
+        # Offset added to a sample for every chip spacing before it
+        self._chip_vec = self.chip_factor * self._n_vec
+        # (N,3) chip offset of every sample column
+        self._chip_vec_per_i = np.ascontiguousarray(
+            self._chip_per_i[:, None] * self._chip_vec)
 
         # The actual measured distance between the [0,0] and [N,0] samples
-        self.length_calibrated = np.sqrt(np.sum((self.n_pt - self.start_pt)**2))
+        self.length_calibrated = float(np.linalg.norm(self._n_vec))
+        self._inv_length_calibrated = 1.0 / self.length_calibrated
+
+        # Contiguous (2,3) projection onto the sample indices and the index
+        # correction applied for every chip spacing, used by the index readback
+        self._NM_hatT = np.ascontiguousarray(self.NM_hat.T)
+        self._chip_correction = np.array(
+            [self.chip_factor*self.length_calibrated, 0])
+
+        # (N,M,3) grid of the (x,y,z) coordinates of every sample index
+        self._ij_to_xyz = np.ascontiguousarray(
+            self.start_pt
+            + np.arange(self.N)[:, None, None]*self.N_hat
+            + np.arange(self.M)[None, :, None]*self.M_hat
+            + self._chip_vec_per_i[:, None, :], dtype=np.float64)
+        self._ij_to_xyz.setflags(write=False)
+
+        # (x,y,z) coordinates of every sample along the snaking path
+        self._k_to_xyz = self._ij_to_xyz[self._k_to_ij[:, 0],
+                                         self._k_to_ij[:, 1]]
+
+        self.calibrated = True
+
         logger.info('Successfully calibrated "{0}"'.format(self.name))
         # Always save the calibration
         self.save_calibration()
@@ -260,10 +375,43 @@ class McgranePalette(Device, FltMvInterface):
 
         j : int
             The j coordinate to move to on the palette
+
+        Returns
+        -------
+        xyz : np.ndarray
+            The coordinates of the sample
         """
-        return (self.start_pt + i*self.N_hat + j*self.M_hat 
-                + self._chip_from_i(i)*self.chip_factor
-                * (self.n_pt - self.start_pt))
+        if (isinstance(i, numbers.Integral) and isinstance(j, numbers.Integral)
+                and 0 <= i < self.N and 0 <= j < self.M):
+            # Use the precomputed grid for valid samples
+            return self._ij_to_xyz[i, j].copy()
+        return (self.start_pt + i*self.N_hat + j*self.M_hat
+                + self._chip_from_i(i)*self._chip_vec)
+
+    @calibrated
+    def locate_2d_batch(self, i, j):
+        """Return the (x,y,z) coordinates of many samples at once.
+
+        Parameters
+        ----------
+        i : array-like of ints
+            The i coordinates of the samples
+
+        j : array-like of ints
+            The j coordinates of the samples
+
+        Returns
+        -------
+        xyz : np.ndarray
+            A (K,3) array with the coordinates of each (i,j) pair
+        """
+        i = np.atleast_1d(i)
+        j = np.atleast_1d(j)
+        xyz = self.start_pt + np.matmul(self.NM_hat, np.stack((i, j))).T
+        if i.size and 0 <= i.min() and i.max() < self.N:
+            # Use the per-column offsets when every column is on the palette
+            return xyz + self._chip_vec_per_i[i]
+        return xyz + self._chip_from_i_array(i)[:, None]*self._chip_vec
 
     @calibrated
     def locate_1d(self, k):
@@ -274,26 +422,65 @@ class McgranePalette(Device, FltMvInterface):
         k : int
             The 1D position to move the motor to
         """
-        # calculate the horizontal row
-        i = int(np.floor(k / (self.M)))
-        # calculate the column w/o snake-wrapping
-        j = k % (self.M)
-        # apply snake-wrapping to odd columns by reversing pathing order 
-        if i % 2:
-            j = (self.M - j) - 1
+        k = _sample_number(k)
+        M = self.M
+        if 0 <= k < self.samples:
+            # Use the precomputed path for valid samples
+            i, j = self._k_to_ij[k]
+            return int(i), int(j)
+        # calculate the horizontal row and the column w/o snake-wrapping
+        i, j = divmod(k, M)
+        # apply snake-wrapping to odd columns by reversing pathing order
+        parity = i & 1
+        j = parity*(M - j - 1) + (1 - parity)*j
+        return i, j
+
+    def locate_1d_batch(self, k):
+        """Return the (i,j) coordinates of many samples at once.
+
+        Parameters
+        ----------
+        k : array-like of ints
+            The 1D positions of the samples
 
-        return np.array([i, j])
+        Returns
+        -------
+        ij : np.ndarray
+            A (K,2) array with the (i,j) indices of each sample
+        """
+        # calculate the horizontal row and the column w/o snake-wrapping
+        i, j = np.divmod(np.atleast_1d(k).astype(int), self.M)
+        # apply snake-wrapping to odd columns by reversing pathing order
+        j = np.where(i & 1, self.M - j - 1, j)
+        return np.stack((i, j), axis=-1)
 
     def move_3d(self, x, y, z, *, timeout=None, wait=False):
         """Move to given (x,y,z) coordinate."""
-        # Move each motor to the corresponding position and collect the status
-        # objects in a list
-        status_list = [motor.move(val, timeout=timeout, wait=False)
-                       for motor, val in zip(self.motors, (x, y, z))]
+        target = np.array((x, y, z), dtype=np.float64)
+        # Skip the move if the palette was already sent here and hasn't left.
+        # Read the motors directly, as the coordinates may be a cached snapshot
+        if (np.all(np.abs(target - self._last_cmd) < 1e-6) and
+                np.all(np.abs([motor.position for motor in self.motors]
+                              - target) < self.move_tolerance)):
+            logger.debug('{0} is already at {1}, skipping the move'.format(
+                self.name, list(target)))
+            status = Status()
+            status.set_finished()
+            return status
+        self._last_cmd = target
+
+        # Move each motor to the corresponding position and combine the status
+        # objects into a single AndStatus
+        try:
+            status = (self.x_motor.move(x, timeout=timeout, wait=False)
+                      & self.y_motor.move(y, timeout=timeout, wait=False)
+                      & self.z_motor.move(z, timeout=timeout, wait=False))
+        except Exception:
+            # The move was rejected, possibly after some of the motors
+            # started, so the next move can't be skipped
+            self._last_cmd = np.full(len(self.motors), np.nan)
+            raise
 
-        # Reduce the list to a single AndStatus
-        status = reduce(lambda s1, s2: s1 & s2, status_list)
-        
         if wait:
             status_wait(status)
         return status
@@ -315,7 +502,8 @@ class McgranePalette(Device, FltMvInterface):
             raise InvalidSampleError('Invalid sample number inputted. Minimum '
                                      'value is 0 and maximum is {0}, but got '
                                      '{1}'.format(self.samples-1, k))
-        return self.move_2d(*self.locate_1d(k), timeout=timeout, wait=wait)
+        return self.move_3d(*self._k_to_xyz[_sample_number(k)],
+                            timeout=timeout, wait=wait)
             
     def move(self, *args, timeout=None, wait=False):
         """Move to the sample number (k), sample index (i,j), or motor 
@@ -338,17 +526,21 @@ class McgranePalette(Device, FltMvInterface):
         wait : bool, optional
             Wait for the motion to complete
         """
-        num_args = len(args)
+        # Select the move function based on the number of arguments passed
+        try:
+            move_func = self._dispatch[len(args)]
+        except IndexError:
+            move_func = None
         # Make sure we get the right number of arguments
-        if num_args > 3:
-            raise ValueError('Cannot pass more than three inputs to move '
+        if move_func is None:
+            raise ValueError('Must pass one, two or three inputs to move '
                              'command, got {0}'.format(len(args)))
-
-        # Select the move function based on the number of arguments passed
-        return self.move_funcs[num_args-1](*args, timeout=timeout, wait=wait)
+        return move_func(*args, timeout=timeout, wait=wait)
 
     def stop(self):
         """Stop all the motors."""
+        # The palette may stop anywhere, so the next move can't be skipped
+        self._last_cmd[:] = np.nan
         for motor in self.motors:
             motor.stop()
 
@@ -454,7 +646,7 @@ class McgranePalette(Device, FltMvInterface):
         hitting ctrl + c.
         """
         # Gets a nicely formatted docstring
-        docstring = getdoc(getattr(self, getframeinfo(currentframe()).function))
+        docstring = self._CALIBRATE_DOC
         new_calibration = []
         
         def shell():
@@ -507,7 +699,7 @@ class McgranePalette(Device, FltMvInterface):
                           list(self.coordinates), coordinate)
                     # Get input from the user if this is a good point
                     response = input(current_position_str)
-                    while response.lower() not in set(['y', 'n']):
+                    while response.lower() not in _YN:
                         # Keep probing until they enter y or n
                         response = input('Invalid input "{0}". ' 
                                          + current_position_str)
@@ -526,7 +718,25 @@ class McgranePalette(Device, FltMvInterface):
     @property
     def coordinates(self):
         """Returns the x,y,z coordinates of the palette."""
-        return np.array([motor.position for motor in self.motors])
+        if self._cached_coords is not None:
+            return self._cached_coords.copy()
+        return np.array([self.x_motor.position, self.y_motor.position,
+                         self.z_motor.position])
+
+    @contextmanager
+    def cached_coordinates(self):
+        """Context manager that reads the motor positions once and uses them
+        for every readback made inside the block.
+
+            with palette.cached_coordinates():
+                print(palette.position, palette.chip, palette.remaining)
+        """
+        previous = self._cached_coords
+        self._cached_coords = self.coordinates
+        try:
+            yield self._cached_coords
+        finally:
+            self._cached_coords = previous
 
     @property
     @calibrated
@@ -541,13 +751,18 @@ class McgranePalette(Device, FltMvInterface):
         index : array
             An array of with the i,j indices of the sample.
         """
-        self.start_diff = self.coordinates - self.start_pt
-        self.raw_index = np.round(
-            np.dot(self.start_diff, self.NM_hat) 
-            - np.array([self.chip*self.chip_factor*self.length_calibrated, 0]))
-        
+        return self._index_from_xyz(self.coordinates)
+
+    def _index_from_xyz(self, coordinates):
+        """Returns the (i,j) palette position based on the inputted
+        coordinates."""
+        start_diff = coordinates - self.start_pt
+        raw_index = np.round(
+            self._NM_hatT @ start_diff
+            - self._chip_from_diff(start_diff)*self._chip_correction)
+
         # The returned index should never exceed the total number of samples
-        return np.minimum(self.raw_index, [self.N-1, self.M-1]).astype(int)
+        return np.minimum(raw_index, [self.N-1, self.M-1]).astype(int)
 
     @property
     @calibrated
@@ -562,7 +777,13 @@ class McgranePalette(Device, FltMvInterface):
         position : int
             The sample position from 0 to `.samples - 1`
         """
-        i, j = self.index
+        return self._position_from_xyz(self.coordinates)
+
+    def _position_from_xyz(self, coordinates):
+        """Returns the sample number based on the inputted coordinates."""
+        i, j = self._index_from_xyz(coordinates)
+        if i >= 0 and j >= 0:
+            return int(self._ij_to_k[i, j])
         return i*self.M + (self.M - j - 1 if i%2 else j)
 
     @property
@@ -579,26 +800,31 @@ class McgranePalette(Device, FltMvInterface):
         remaining : int
             Number of samples left in the palette.
         """
-        return int(self.samples - self.position - 1)
+        return int(self.samples - self._position_from_xyz(self.coordinates)
+                   - 1)
 
-    @calibrated
     def _chip_from_i(self, i):
         """Returns the chip number based on the inputted column."""
-        for idx, val in enumerate(self.chip_dims):
-            if i < sum(self.chip_dims[:idx+1]):
-                return idx
+        return int(self._chip_cumsum.searchsorted(i, side='right'))
+
+    def _chip_from_i_array(self, i):
+        """Returns an array of chip numbers for an array of columns."""
+        return np.searchsorted(self._chip_cumsum, i, side='right')
 
-    @calibrated
     def _chip_from_xyz(self, coordinates):
-        """Returns the chip number based on the inputted coordinates."""
-        self.start_diff = coordinates - self.start_pt
-        self.percent_complete = (np.dot(self.start_diff, self.N_hat)
-                            / np.sqrt(np.sum((self.n_pt - self.start_pt)**2)))
-        
-        for i, val in enumerate(self.chip_dims_percents[::-1]):
-            if self.percent_complete > val:
-                return min(self.num_chips - i + 1, self.num_chips)
-        return 0
+        """Returns the chip number based on the inputted coordinates, or an
+        array of chip numbers if a (K,3) array of coordinates is passed."""
+        return self._chip_from_diff(coordinates - self.start_pt)
+
+    def _chip_from_diff(self, start_diff):
+        """Returns the chip number based on the offset of the coordinates from
+        the [0,0] sample."""
+        percent_complete = ((start_diff @ self.N_hat)
+                            * self._inv_length_calibrated)
+        # Count the chips whose end has been passed
+        return np.minimum(np.searchsorted(self.chip_dims_percents,
+                                          percent_complete, side='left'),
+                          self.num_chips)
         
     @property
     @calibrated
@@ -626,3 +852,7 @@ class McgranePalette(Device, FltMvInterface):
         """Sets the settle time for all the motors."""
         for motor in self.motors:
             motor.settle_time = value
+
+
+# Formatted calibrate docstring, printed as help during the calibration
+McgranePalette._CALIBRATE_DOC = getdoc(McgranePalette.calibrate)
@@ -1,8 +1,8 @@
 import logging
-import time
 
+import numpy as np
 import pandas as pd
-from bluesky.plan_stubs import abs_set, rel_set, checkpoint
+from bluesky.plan_stubs import abs_set, rel_set, checkpoint, sleep
 from bluesky.plans import scan, inner_product_scan, list_scan
 from bluesky.preprocessors import stub_wrapper
 
@@ -45,15 +45,26 @@ def mcgrane_scan(outer_motor, inner_motor, sequencer, outer_start,
         a list, it is the list of relative motions to perform at every outer
         step
 
+    inner_step_size : int, optional
+        Relative motion of each inner step when `inner_steps` is an int
+
     wait : float, optional
         The amount of time to wait at each step     
     """
     # Create the list of relative motions that will be performed
     if isinstance(inner_steps, int):
-        # If it is an int, create a list of unit motions of that length
-        inner_steps = [1] * inner_steps
+        # If it is an int, move by the step size that many times
+        inner_steps = [inner_step_size] * inner_steps
+
+    # Preallocate the scan results, keeping the integer columns (chip, sample,
+    # i, j) apart from the float ones (mono, x, y, z)
+    n_rows = int(outer_steps) * len(inner_steps)
+    float_buf = np.empty((n_rows, 4), dtype=np.float64)
+    int_buf = np.empty((n_rows, 4), dtype=np.int64)
+    row_idx = 0
 
-    scan_positions = []
+    outer_name = outer_motor.name
+    inner_name = inner_motor.name
 
     # Define what will be done at every monochrometer step
     def outer_per_step(detectors, motor, step):
@@ -61,22 +72,22 @@ def mcgrane_scan(outer_motor, inner_motor, sequencer, outer_start,
         yield from checkpoint()
 
         # Move the monochrometer to the inputted energy
-        logger.info('Outer Step: Moving {0} to {1}'.format(
-            outer_motor.name, step))
+        logger.info('Outer Step: Moving %s to %s', outer_name, step)
         yield from abs_set(outer_motor, step, wait=True)
 
         # Define what we will do at every motor step
         def inner_per_step(detectors, motor, step):
+            nonlocal row_idx
             # Set a checkpoint in case the scan is interrupted
             yield from checkpoint()
 
             # Notify the user where we are trying to move to
-            goal_sample = inner_motor.position + inner_step_size
+            goal_sample = inner_motor.position + step
             goal_index = inner_motor.locate_1d(goal_sample)
-            logger.info('Inner Step: Moving {0} to {1} (sample {2})'.format(
-                inner_motor.name, goal_index, goal_sample))
+            logger.info('Inner Step: Moving %s to %s (sample %s)', inner_name,
+                        goal_index, goal_sample)
             # Move the motor to the inputted step
-            yield from rel_set(inner_motor, inner_step_size, wait=True)
+            yield from rel_set(inner_motor, step, wait=True)
 
             if use_sequencer:
                 # # Start and wait for the sequencer
@@ -85,16 +96,18 @@ def mcgrane_scan(outer_motor, inner_motor, sequencer, outer_start,
 
             # Wait the specified amount of time
             if wait:
-                logger.info("Inner Step: Waiting for {0} second(s)...".format(
-                    wait))
-                time.sleep(wait)
-
-            # Fill the dataframe
-            scan_positions.append((outer_motor.position, 
-                                   inner_motor.chip,
-                                   inner_motor.position,
-                                   *inner_motor.index,
-                                   *inner_motor.coordinates))
+                logger.info("Inner Step: Waiting for %s second(s)...", wait)
+                yield from sleep(wait)
+
+            # Fill the next row of the results, reading the palette motors
+            # once for all of its readbacks
+            float_buf[row_idx, 0] = outer_motor.position
+            with inner_motor.cached_coordinates() as coordinates:
+                float_buf[row_idx, 1:] = coordinates
+                int_buf[row_idx, 0] = inner_motor.chip
+                int_buf[row_idx, 1] = inner_motor.position
+                int_buf[row_idx, 2:] = inner_motor.index
+            row_idx += 1
  
         # Define the larger inner scan as a list_scan. We cannot use
         # rel_list_scan because it includes the reset_positions_decorator,
@@ -116,9 +129,14 @@ def mcgrane_scan(outer_motor, inner_motor, sequencer, outer_start,
                                                  inner_motor.index, 
                                                  inner_motor.position))
 
-    # Create the dataframe and return it
+    # Create the dataframe from the filled rows and return it
     columns = ('mono', 'chip', 'sample', 'i', 'j', 'x', 'y', 'z')
-    df = pd.DataFrame(scan_positions, columns=columns)
+    floats = float_buf[:row_idx]
+    ints = int_buf[:row_idx]
+    df = pd.DataFrame({'mono': floats[:, 0], 'chip': ints[:, 0],
+                       'sample': ints[:, 1], 'i': ints[:, 2], 'j': ints[:, 3],
+                       'x': floats[:, 1], 'y': floats[:, 2], 'z': floats[:, 3]},
+                      columns=columns)
     df.index.name = 'Scan Step'
     return df
 
@@ -0,0 +1,89 @@
+import logging
+
+import numpy as np
+import pytest
+from bluesky import RunEngine
+from ophyd.device import Component as Cpt
+from ophyd.sim import SynAxis, make_fake_device
+
+from sxr.devices import Sequencer
+
+from ..devices import McgranePalette
+
+logger = logging.getLogger(__name__)
+
+
+class SimMotor(SynAxis):
+    """Simulated motor with the move interface and limits of the palette
+    motors. Counts the moves it is asked to make."""
+    low_limit = -100
+    high_limit = 100
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.moves = 0
+
+    def check_value(self, value):
+        if not self.low_limit <= value <= self.high_limit:
+            raise ValueError('{0} is outside of the limits of {1}'.format(
+                value, self.name))
+
+    def move(self, position, wait=False, timeout=None, **kwargs):
+        self.check_value(position)
+        self.moves += 1
+        status = self.set(position)
+        if wait:
+            status.wait()
+        return status
+
+
+class SimPalette(McgranePalette):
+    x_motor = Cpt(SimMotor, name='x')
+    y_motor = Cpt(SimMotor, name='y')
+    z_motor = Cpt(SimMotor, name='z')
+    rot_motor = Cpt(SimMotor, name='rot')
+
+
+class SimSequencer(make_fake_device(Sequencer)):
+    """Simulated sequencer that reports playing whenever it is started."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.play_status.sim_put(0)
+        self.state_control.subscribe(self._on_state_control, run=False)
+
+    def _on_state_control(self, value=None, **kwargs):
+        self.play_status.sim_put(2 if value else 0)
+
+
+@pytest.fixture(scope='function')
+def fresh_RE():
+    """RunEngine that isn't shared with the other tests."""
+    return RunEngine({})
+
+
+@pytest.fixture(scope='function')
+def sequencer():
+    """Stopped simulated sequencer."""
+    return SimSequencer('ECS:SYS0:2', name='Test Sequencer')
+
+
+@pytest.fixture(scope='function')
+def palette(tmp_path):
+    """Calibrated palette using simulated motors."""
+    palette = SimPalette(name='Test Palette', dir_calib=tmp_path)
+    palette._accept_calibration(np.array([1.0, 2.0, 0.5]),
+                                np.array([90.0, 5.0, 1.5]),
+                                np.array([0.5, 25.0, -0.5]))
+    return palette
+
+
+@pytest.fixture(scope='function')
+def aligned_palette(tmp_path):
+    """Calibrated palette with its axes along the motor axes and 1 mm between
+    samples, so that the index and position readbacks are exact."""
+    palette = SimPalette(name='Test Palette', dir_calib=tmp_path)
+    n_length = (palette.N - 1) / (1 - palette.num_chips*palette.chip_factor)
+    palette._accept_calibration(np.array([0.0, 0.0, 0.0]),
+                                np.array([n_length, 0.0, 0.0]),
+                                np.array([0.0, palette.M - 1.0, 0.0]))
+    return palette
@@ -0,0 +1,189 @@
+import json
+import logging
+
+import numpy as np
+import pytest
+
+from sxr.exceptions import InputError
+
+from ..exceptions import InvalidSampleError
+from .conftest import SimPalette
+
+logger = logging.getLogger(__name__)
+
+
+def test_move_3d_skips_repeated_move(palette):
+    palette.move(1, 2, 3, wait=True)
+    moves = [motor.moves for motor in palette.motors]
+    status = palette.move(1, 2, 3, wait=True)
+    assert status.done and status.success
+    assert [motor.moves for motor in palette.motors] == moves
+
+
+def test_move_3d_moves_after_stop(palette):
+    palette.move(1, 2, 3, wait=True)
+    moves = palette.x_motor.moves
+    palette.stop()
+    palette.move(1, 2, 3, wait=True)
+    assert palette.x_motor.moves == moves + 1
+
+
+def test_move_3d_moves_after_drift(palette):
+    palette.move(1, 2, 3, wait=True)
+    moves = palette.x_motor.moves
+    # Push the readback just past the tolerance
+    palette.x_motor.set(1 + 2*palette.move_tolerance).wait()
+    palette.move(1, 2, 3, wait=True)
+    assert palette.x_motor.moves == moves + 1
+    assert np.allclose(palette.coordinates, [1, 2, 3])
+
+
+def test_move_3d_moves_inside_cached_coordinates(palette):
+    palette.move(1, 2, 3, wait=True)
+    with palette.cached_coordinates():
+        # The cached coordinates still show the palette at the target
+        palette.x_motor.set(50).wait()
+        moves = palette.x_motor.moves
+        palette.move(1, 2, 3, wait=True)
+        assert palette.x_motor.moves == moves + 1
+    assert np.allclose(palette.coordinates, [1, 2, 3])
+
+
+def test_move_3d_rejected_move_is_not_skipped(palette):
+    palette.move(1, 2, 3, wait=True)
+    # z is outside of its limits, so the move fails after x and y started
+    with pytest.raises(ValueError):
+        palette.move(4, 5, 1000)
+    assert np.isnan(palette._last_cmd).all()
+    palette.z_motor.high_limit = 2000
+    moves = palette.z_motor.moves
+    palette.move(4, 5, 1000, wait=True)
+    assert palette.z_motor.moves == moves + 1
+    assert np.allclose(palette.coordinates, [4, 5, 1000])
+
+
+def test_move_1d_float_sample(palette):
+    palette.mv(5.0)
+    assert np.allclose(palette.coordinates, palette.locate_2d(0, 5))
+    assert palette.position == 5
+    with pytest.raises(InvalidSampleError):
+        palette.mv(5.5)
+
+
+def test_locate_1d_batch_matches_locate_1d(palette):
+    k = np.arange(palette.samples)
+    ij = palette.locate_1d_batch(k)
+    assert ij.shape == (palette.samples, 2)
+    assert [tuple(index) for index in ij] == [tuple(palette.locate_1d(sample))
+                                              for sample in k]
+    # Odd columns are traversed in reverse
+    assert tuple(ij[palette.M - 1]) == (0, palette.M - 1)
+    assert tuple(ij[palette.M]) == (1, palette.M - 1)
+    assert tuple(ij[2*palette.M - 1]) == (1, 0)
+
+
+@pytest.mark.parametrize('k', [5, 5.0, -3, 10**4])
+def test_locate_1d_returns_ints(palette, k):
+    ij = palette.locate_1d(k)
+    assert all(type(index) is int for index in ij)
+    assert ij == tuple(palette.locate_1d_batch(int(k))[0])
+
+
+@pytest.mark.parametrize('k', [3.7, float('nan'), 'a'])
+def test_locate_1d_rejects_non_integers(palette, k):
+    with pytest.raises(InvalidSampleError):
+        palette.locate_1d(k)
+
+
+def test_locate_2d_batch_matches_locate_2d(palette):
+    i, j = np.meshgrid(np.arange(palette.N), np.arange(palette.M),
+                       indexing='ij')
+    i, j = i.ravel(), j.ravel()
+    xyz = palette.locate_2d_batch(i, j)
+    assert xyz.shape == (palette.samples, 3)
+    for row, (sample_i, sample_j) in zip(xyz, zip(i, j)):
+        assert np.allclose(row, palette.locate_2d(sample_i, sample_j))
+    # Indices off of the palette are extrapolated the same way
+    i = np.array([-1, palette.N, 3])
+    j = np.array([0, 1, palette.M])
+    for row, (sample_i, sample_j) in zip(palette.locate_2d_batch(i, j),
+                                         zip(i, j)):
+        assert np.allclose(row, palette.locate_2d(sample_i, sample_j))
+
+
+def test_locate_2d_float_indices(palette):
+    assert np.allclose(palette.locate_2d(2.0, 3.0), palette.locate_2d(2, 3))
+    # Fractional indices are interpolated between the samples
+    assert np.allclose(palette.locate_2d(2.5, 3),
+                       (palette.start_pt + 2.5*palette.N_hat
+                        + 3*palette.M_hat
+                        + palette._chip_from_i(2.5)*palette._chip_vec))
+    palette.mv(2.0, 3.0)
+    assert np.allclose(palette.coordinates, palette.locate_2d(2, 3))
+
+
+def test_cached_coordinates(palette):
+    palette.move(5, 7, wait=True)
+    position, chip = palette.position, palette.chip
+    with palette.cached_coordinates() as coordinates:
+        assert np.allclose(coordinates, palette.locate_2d(5, 7))
+        # Motion inside the block isn't seen by the readbacks
+        palette.x_motor.set(palette.x_motor.position + 50).wait()
+        assert np.allclose(palette.coordinates, coordinates)
+        assert palette.position == position
+        assert palette.chip == chip
+        assert palette.remaining == palette.samples - position - 1
+    # ...but it is once the block exits
+    assert palette.position != position
+    assert palette.coordinates[0] == palette.x_motor.position
+
+
+def test_cached_coordinates_released_on_error(palette):
+    with pytest.raises(RuntimeError):
+        with palette.cached_coordinates():
+            raise RuntimeError('Scan failed')
+    palette.x_motor.set(palette.x_motor.position + 50).wait()
+    assert palette.coordinates[0] == palette.x_motor.position
+
+
+def test_cached_coordinates_nested(palette):
+    with palette.cached_coordinates() as outer:
+        palette.x_motor.set(palette.x_motor.position + 50).wait()
+        with palette.cached_coordinates() as inner:
+            assert np.allclose(inner, outer)
+        # The outer cache is restored when the inner block exits
+        assert np.allclose(palette.coordinates, outer)
+
+
+def test_accept_degenerate_calibration(palette):
+    start_pt = palette.start_pt
+    locate = palette.locate_2d(3, 4)
+    with pytest.raises(InputError):
+        palette._accept_calibration(start_pt, start_pt, palette.m_pt)
+    # The previous calibration is kept
+    assert palette.calibrated
+    assert np.allclose(palette.locate_2d(3, 4), locate)
+    uncalibrated = SimPalette(name='Uncalibrated Palette',
+                              dir_calib=palette.dir_calib)
+    with pytest.raises(InputError):
+        uncalibrated._accept_calibration(start_pt, palette.n_pt, start_pt)
+    assert not uncalibrated.calibrated
+
+
+@pytest.mark.parametrize('name', ['calibration.npy', 'calibration.json',
+                                  'calibration_old'])
+def test_load_calibration(palette, name):
+    if name.endswith('.npy'):
+        palette.save_calibration(name)
+    else:
+        # Calibrations used to be saved as json, not always with the suffix
+        with open(str(palette.dir_calib / name), 'w') as calib:
+            json.dump([list(pt) for pt in palette.calibration_coordinates],
+                      calib)
+    loaded = SimPalette(name='Loaded Palette', dir_calib=palette.dir_calib)
+    loaded.load_calibration(name, confirm_overwrite=False)
+    assert loaded.calibrated
+    for expected, point in zip(palette.calibration_coordinates,
+                               loaded.calibration_coordinates):
+        assert np.allclose(point, expected)
+    assert np.allclose(loaded.locate_2d(3, 4), palette.locate_2d(3, 4))
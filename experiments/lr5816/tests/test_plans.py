@@ -4,22 +4,29 @@ import pytest
 from bluesky.preprocessors  import run_wrapper
 from ophyd.sim import SynAxis
 
-from .conftest import SynSequencer
-from ..plans import mcgrain_scan
+from ..plans import mcgrane_scan
 
 logger = logging.getLogger(__name__)
 
 
-def test_mcgrain_scan(fresh_RE):
+def test_mcgrane_scan(fresh_RE, aligned_palette, sequencer):
     m1 = SynAxis(name="m1")
-    m2 = SynAxis(name="m2")
-    seq = SynSequencer('', name='sequencer')
-    
+    pal = aligned_palette
+    pal.mv(0)
+    results = []
+
     def test_plan():
-        yield from mcgrain_scan(m1, m2, seq, 0, 5, 6, 5)
-        assert m1.position == 5.0
-        assert m2.position == 30
-        assert seq.state_control.get() == 1
+        df = yield from mcgrane_scan(m1, pal, sequencer, 0, 5, 6, 5)
+        results.append(df)
 
-    # Send all metadata/data captured to the BestEffortCallback.
     fresh_RE(run_wrapper(test_plan()))
+    assert m1.position == 5.0
+    assert pal.position == 30
+    assert sequencer.state_control.get() == 1
+
+    # One row for every inner step
+    df, = results
+    assert len(df) == 30
+    assert list(df['sample']) == list(range(1, 31))
+    assert list(df['mono']) == [float(mono) for mono in range(6)
+                                for _ in range(5)]
@@ -14,21 +14,20 @@ from .utils import calibrated
 
 logger = logging.getLogger(__name__)
 
-# Devices        
 
 class User(object):
-    # Devices
-    monochrometer = IMS("SXR:MON:MMS:06", name="Monochrometer Pitch")
-    sequencer = Sequencer("ECS:SYS0:2", name="Event Sequencer")
-    palette = McgranePalette(name="Mcgrane Palette")
+    # Devices, created the first time they are used
+    _monochrometer = None
+    _sequencer = None
+    _palette = None
 
     def __init__(self, *args, **kwargs):
         """User class for the LR58 Mcgrane experiment.
 
         For the LR58 Mcgrane experiment, an abstracted class for the sample 
         palette and scheme for scanning through this palette were implemented. 
-        The palette device is provided here as class attribute named `palette`. 
-        Additionally, there are two other class attribute devices provided, 
+        The palette device is provided here as an attribute named `palette`. 
+        Additionally, there are two other devices provided as attributes, 
         `monochrometer` for the monochrometer pitch motor, and `sequencer` for 
         the SXR event sequencer.
 
@@ -44,13 +43,48 @@ class User(object):
         self.dir_scans = self.dir_experiment / 'mcgrane_scans'
         self.dir_calibrations = self.dir_experiment / 'calibrations'
 
-        logger.info('Mcgrane scan results will be stored in "{0}"'.format(
-            str(self.dir_scans)))
-        logger.info('Palette calibrations will be stored in "{0}"'.format(
-            str(self.dir_calibrations)))
+        # Make the scan directory accessible to everyone up front
+        try:
+            self.dir_scans.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning('Could not create the scan directory "%s": %s',
+                           self.dir_scans, e)
+        else:
+            try:
+                self.dir_scans.chmod(0o777)
+            except OSError as e:
+                logger.warning('Could not set the permissions of the scan '
+                               'directory "%s": %s', self.dir_scans, e)
+
+        logger.info('Mcgrane scan results will be stored in "%s"',
+                    self.dir_scans)
+        logger.info('Palette calibrations will be stored in "%s"',
+                    self.dir_calibrations)
 
         self.palette.load_calibration(confirm_overwrite=False)
 
+    @property
+    def monochrometer(self):
+        """Monochrometer pitch motor."""
+        if self._monochrometer is None:
+            self._monochrometer = IMS("SXR:MON:MMS:06",
+                                      name="Monochrometer Pitch")
+        return self._monochrometer
+
+    @property
+    def sequencer(self):
+        """SXR event sequencer."""
+        if self._sequencer is None:
+            self._sequencer = Sequencer("ECS:SYS0:2", name="Event Sequencer")
+        return self._sequencer
+
+    @property
+    def palette(self):
+        """Mcgrane sample palette."""
+        if self._palette is None:
+            self._palette = McgranePalette(name="Mcgrane Palette")
+        return self._palette
+
     def mcgrane_scan(self, mono_start, mono_stop, mono_steps, palette_steps, 
                      mono=None, palette=None, seq=None, df_name=None, *args, 
                      **kwargs):
@@ -98,7 +132,8 @@ class User(object):
             Number of samples to move through at each monochrometer step
 
         df_name : str, optional
-            Name to use for the outputted scan csv
+            Name to use for the outputted scan csv. Names ending in .parquet
+            are written as parquet files instead (requires pyarrow)
 
         use_sequencer : bool, optional
             Start the sequencer at every step of the scan
@@ -126,17 +161,18 @@ class User(object):
         logger.info('Scan complete!')
         
         # Save the dataframe
-        df_name = df_name or 'scan_{0}.json'.format(
+        df_name = df_name or 'scan_{0}.csv'.format(
             time.strftime("%Y%m%d_%H%M%S"))
         df_path = self.dir_scans / df_name
-
-        # Make the parent directory if it doesnt exist 
-        if not df_path.parent.exists():
-            df_path.parent.mkdir()
-            df_path.parent.chmod(0o777)
-
-        # Create the directories if they dont exist
-        logger.info('Saving scan to "{0}"'.format(str(df_path)))
-        df.to_csv(str(df_path))
+        # Make the directory again in case it was removed during the session
+        df_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info('Saving scan to "%s"', df_path)
+        if df_path.suffix == '.parquet':
+            df.to_parquet(df_path)
+        else:
+            # Limit the float precision and write in chunks to speed up the
+            # save
+            df.to_csv(df_path, float_format='%.10g', chunksize=10000)
         # Set permissions to be accessible to everyone
         df_path.chmod(0o777)
@@ -38,8 +38,3 @@ class LT00BeamShutter(BeamShutter):
 
     def resume(self):
         self.remove()
-
-shutter = LT00BeamShutter('SXR:SPS:MPA:01', name='SXR shutter')
-
-
-
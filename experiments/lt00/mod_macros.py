@@ -1,42 +1,60 @@
 import logging
+from functools import partial
 
-from bluesky import RunEngine
 from bluesky.preprocessors import run_wrapper
 
-from experiments.lt00.mod_devices import shutter
+from experiments.lt00.mod_devices import LT00BeamShutter
 from experiments.lt00.mod_plans import rel_smooth_sweep
-from bluesky.callbacks.best_effort import BestEffortCallback
-from bluesky.utils import ProgressBarManager
+from experiments.lu20.plans import rel_smooth_sweep_test
+from sxr.exceptions import InputError
+from sxr.macros import get_RE
 
 from pcdsdevices.epics_motor import IMS
 
 
 logger = logging.getLogger(__name__)
 
+
 def macro_sweep_test(target):
     logging.info('macro_sweep_test initiated with target {:0.4f}'.format(
         target
     ))
-    RE = RunEngine({})
-    bec = BestEffortCallback()
-    RE.subscribe(bec)
-    RE.waiting_hook = ProgressBarManager()
-    RE(run_wrapper(rel_smooth_sweep_test(tst_23,target)))
-
-sample_x = IMS(
-    prefix='SXR:EXP:MMS:43',
-    name='Sample X axis VT50 motor'
-)
-
-sample_y = IMS(
-    prefix='SXR:EXP:MMS:44',
-    name='Sample Y axis VT50 motor'
-)
-
-sample_z = IMS(
-    prefix='SXR:EXP:MMS:45',
-    name='Sample Z axis VT50 motor'
-)
+    RE = get_RE()
+    RE(run_wrapper(rel_smooth_sweep_test(get_device('test_motor'), target)))
+
+
+# Devices used by the macros, only created the first time they are needed
+_device_factories = {
+    'test_motor': partial(IMS, prefix='SXR:EXP:MMS:23', name='test_motor'),
+    'shutter': partial(LT00BeamShutter, 'SXR:SPS:MPA:01', name='SXR shutter'),
+    'sample_x': partial(IMS, prefix='SXR:EXP:MMS:43',
+                        name='Sample X axis VT50 motor'),
+    'sample_y': partial(IMS, prefix='SXR:EXP:MMS:44',
+                        name='Sample Y axis VT50 motor'),
+    'sample_z': partial(IMS, prefix='SXR:EXP:MMS:45',
+                        name='Sample Z axis VT50 motor'),
+}
+_devices = {}
+
+
+def get_device(name):
+    """
+    Returns the named device used by the macros, creating it if necessary.
+
+    Parameters
+    ----------
+    name : str
+        One of 'test_motor', 'shutter', 'sample_x', 'sample_y' or 'sample_z'.
+    """
+    if name not in _devices:
+        try:
+            factory = _device_factories[name]
+        except KeyError:
+            raise InputError('Unknown device "{0}", must be one of {1}'.format(
+                name, sorted(_device_factories))) from None
+        _devices[name] = factory()
+    return _devices[name]
+
 
 def macro_VT50_smooth_sweep(short_edge_end, long_edge_end, n_strokes,
             scalar=1.0, min_base=.05, min_v=.07,  both_directions=True):
@@ -80,15 +98,12 @@ def macro_VT50_smooth_sweep(short_edge_end, long_edge_end, n_strokes,
         Values larger than 2 are not recommended. 
     """
 
-    RE = RunEngine({})
-    bec = BestEffortCallback()
-    RE.subscribe(bec)
-    RE.waiting_hook = ProgressBarManager()
+    RE = get_RE()
     RE(run_wrapper(rel_smooth_sweep(
-            mot_x=sample_x,
-            mot_y=sample_y,
-            mot_z=sample_z,
-            shutter=shutter,
+            mot_x=get_device('sample_x'),
+            mot_y=get_device('sample_y'),
+            mot_z=get_device('sample_z'),
+            shutter=get_device('shutter'),
             short_edge_end=short_edge_end,
             long_edge_end=long_edge_end,
             n_strokes=n_strokes,
@@ -6,8 +6,10 @@ import numpy as np
 from bluesky.plan_stubs import mv, one_nd_step, abs_set, wait as plan_wait
 from bluesky.plans import scan, inner_product_scan, rel_scan
 from bluesky.preprocessors import stub_wrapper
+from bluesky.utils import FailedStatus
 
-from experiments.lu20.plans import xy_sequencer
+from experiments.lu20.plans import xy_sequencer_array
+from sxr.exceptions import InputError
 
 def xyz_sequencer(origin, short_edge_end, long_edge_end, n_strokes):
     """
@@ -34,56 +36,52 @@ def xyz_sequencer(origin, short_edge_end, long_edge_end, n_strokes):
     np.array
         This two dimensional numpy array lists out the points to visit. 
 
+    Raises
+    ------
+    InputError
+        If any of the points isn't 3-length.
     """
-    
-    if type(origin) is not np.ndarray:
-        _origin = np.array(origin)
-    else:
-        _origin = origin
-    
-    if type(short_edge_end) is not np.ndarray:
-        _short_edge_end = np.array(short_edge_end)
-    else:
-        _short_edge_end = _short_edge_end
-    
-    if type(long_edge_end) is not np.ndarray:
-        _long_edge_end = np.array(long_edge_end)
-    else:
-        _long_edge_end = long_edge_end
+    _origin = np.asarray(origin, dtype=np.float64)
+    _short_edge_end = np.asarray(short_edge_end, dtype=np.float64)
+    _long_edge_end = np.asarray(long_edge_end, dtype=np.float64)
+    # Anything but 3-length points would silently broadcast in the product
+    if not (_origin.shape == _short_edge_end.shape == _long_edge_end.shape
+            == (3,)):
+        raise InputError('origin, short_edge_end and long_edge_end must be '
+                         '(x,y,z) points. Got shapes {0}, {1} and {2}'.format(
+                             _origin.shape, _short_edge_end.shape,
+                             _long_edge_end.shape))
 
     delta_short = _short_edge_end - _origin # x_end minus origin
     delta_long = _long_edge_end - _origin # y_end minus origin
 
-    #print(delta_short)
-    #print(delta_long)
-    
-    # Use a dimensionless unitvectors for ez-maths
-    xy_unit_sequence = xy_sequencer(
+    # Nothing to sweep, stay at the origin
+    if n_strokes == 0:
+        return _origin[np.newaxis].copy()
+    # A single sweep along the long edge and one short step, with no reset
+    if n_strokes == 1:
+        return np.stack((_origin, _long_edge_end,
+                         _long_edge_end + delta_short))
+
+    # Use a dimensionless unitvectors for ez-maths. Don't reset the sample at
+    # the end with a return along the long stroke axis if the last sweep (an
+    # odd number of sweeps) leaves the laser on the opposite side of the sample
+    xy_unit_matrix = xy_sequencer_array(
         start_x = 0,
         start_y = 0,
         stroke_height = 1,
         stroke_spacing = 1/n_strokes,
         n_strokes = n_strokes,
         both_directions = True,
+        reset = n_strokes % 2 == 0,
     )
 
-    # Don't reset the sample at the end with a return along the long stroke
-    # axis if the last sweep (an odd number of sweeps) leaves the laser on the
-    # opposite side of the sample
-    if n_strokes % 2 != 0:
-        xy_unit_sequence = xy_unit_sequence[:-1]
-    
-    # Convert list of unit vectors into matrix of vectors for the transform
-    xy_unit_matrix = np.array(xy_unit_sequence)
-    xy_unit_matrix = xy_unit_matrix.T
+    # (2,3) basis for transforming unit vectors into relevnt space
+    basis = np.stack((delta_short, delta_long))
 
-    # Create the matrix for transforming unit vectors into relevnt space
-    conversion_matrix = np.array([delta_short,delta_long]).T    
-    
     # Convert from unit to actual vectors
-    result_points = np.dot(conversion_matrix, xy_unit_matrix)
-    result_points = result_points.T
-    result_points = result_points + _origin
+    result_points = xy_unit_matrix @ basis
+    result_points += _origin
 
 
     return result_points
@@ -115,20 +113,9 @@ def xyz_velocities(origin, short_edge_end, long_edge_end, scalar=1.0):
         This two dimensional numpy array lists out the points to visit. 
 
     """
-    if type(origin) is not np.ndarray:
-        _origin = np.array(origin)
-    else:
-        _origin = origin
-    
-    if type(short_edge_end) is not np.ndarray:
-        _short_edge_end = np.array(short_edge_end)
-    else:
-        _short_edge_end = _short_edge_end
-    
-    if type(long_edge_end) is not np.ndarray:
-        _long_edge_end = np.array(long_edge_end)
-    else:
-        _long_edge_end = long_edge_end
+    _origin = np.asarray(origin, dtype=np.float64)
+    _short_edge_end = np.asarray(short_edge_end, dtype=np.float64)
+    _long_edge_end = np.asarray(long_edge_end, dtype=np.float64)
 
     # Calculate motion vector
     short_vector = (_short_edge_end - _origin)
@@ -197,6 +184,10 @@ def rel_smooth_sweep(mot_x, mot_y, mot_z, shutter, short_edge_end,
     max_velocity_val = 14.9998
     # Value for Maximum velocity
     max_velocity = 15
+    # The motor record may round or clamp the velocities it is sent, so don't
+    # require an exact readback of them or wait on them for long
+    velocity_tolerance = 1e-4
+    velocity_timeout = 2
     both_directions = True
     initiate_str = """Initiating rel_smooth_sweep:
     mot_x = {mot_x}
@@ -206,23 +197,24 @@ def rel_smooth_sweep(mot_x, mot_y, mot_z, shutter, short_edge_end,
     n_strokes = {n_strokes}
     both_directions = {both_directions}
     """
-    logging.info(initiate_str.format(
-        mot_x=mot_x,
-        mot_y=mot_y,
-        mot_z=mot_z,
-        shutter=shutter,
-        n_strokes=n_strokes,
-        both_directions=both_directions,
-    ))
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(initiate_str.format(
+            mot_x=mot_x,
+            mot_y=mot_y,
+            mot_z=mot_z,
+            shutter=shutter,
+            n_strokes=n_strokes,
+            both_directions=both_directions,
+        ))
 
     logging.info('Start time: {}'.format(datetime.datetime.now().strftime(
         "%Y/%m/%d %H:%M:%S"
     )))
 
     # Generate path
-    start_x = mot_x.get().user_readback
-    start_y = mot_y.get().user_readback
-    start_z = mot_z.get().user_readback
+    start_x = mot_x.user_readback.get()
+    start_y = mot_y.user_readback.get()
+    start_z = mot_z.user_readback.get()
     logging.info('Motors starting at: ({x:0.4f},{y:0.4f},{z:0.4f})'.format(
         x=start_x,
         y=start_y,
@@ -243,10 +235,11 @@ def rel_smooth_sweep(mot_x, mot_y, mot_z, shutter, short_edge_end,
         scalar
     )
 
-    short_velocity = np.clip(
-        short_velocity, min_velocity_val, max_velocity_val)
-    long_velocity = np.clip(
-        long_velocity, min_velocity_val, max_velocity_val)
+    # xyz_velocities returns new arrays, so they can be clipped in place
+    np.clip(short_velocity, min_velocity_val, max_velocity_val,
+            out=short_velocity)
+    np.clip(long_velocity, min_velocity_val, max_velocity_val,
+            out=long_velocity)
 
     coord_list = xyz_sequencer(
         origin=(start_x, start_y, start_z),
@@ -263,12 +256,22 @@ def rel_smooth_sweep(mot_x, mot_y, mot_z, shutter, short_edge_end,
     logging.info('Long edge end: {}'.format(long_edge_end))
     logging.info('Target coordinate list: {}'.format(coord_list))
 
+    # Velocity of every line, alternating between the short and long strokes
+    velocity_schedule = np.where(
+        (np.arange(len(coord_list)) % 2 == 1)[:, None],
+        long_velocity, short_velocity)
+
     # Remove shutter
     logging.debug('Removing shutter')
     # shutter.remove()
     yield from abs_set(shutter, "OUT")
  
+    for mot in (mot_x, mot_y, mot_z):
+        if mot.velocity.tolerance is None:
+            mot.velocity.tolerance = velocity_tolerance
+
     # Make the individual moves -- continue working here
+    last_velocity = None
     for line_no, line in enumerate(coord_list):
         '''
         if not both_directions:
@@ -280,31 +283,39 @@ def rel_smooth_sweep(mot_x, mot_y, mot_z, shutter, short_edge_end,
                 shutter.insert()
         '''
 
-        if both_directions:
-            if line_no % 2 == 1:
-                logging.info("Long Velocity: " + str(long_velocity))
-                mot_x.velocity.put(long_velocity[0])
-                mot_y.velocity.put(long_velocity[1])
-                mot_z.velocity.put(long_velocity[2])
-            else:
-                logging.info("Short Velocity: " + str(short_velocity))
-                mot_x.velocity.put(short_velocity[0])
-                mot_y.velocity.put(short_velocity[1])
-                mot_z.velocity.put(short_velocity[2])
+        velocity = velocity_schedule[line_no]
+        # Only write the velocities when they differ from the previous line
+        if both_directions and (last_velocity is None
+                                or not np.array_equal(velocity, last_velocity)):
+            logging.info("Velocity: %s", velocity)
+            # Send the three velocities together and wait for all of them
+            yield from abs_set(mot_x.velocity, velocity[0], group='velocity',
+                               timeout=velocity_timeout)
+            yield from abs_set(mot_y.velocity, velocity[1], group='velocity',
+                               timeout=velocity_timeout)
+            yield from abs_set(mot_z.velocity, velocity[2], group='velocity',
+                               timeout=velocity_timeout)
+            try:
+                yield from plan_wait('velocity')
+            except FailedStatus:
+                logging.warning('The motors did not report the velocity %s, '
+                                'continuing with the velocities they accepted',
+                                velocity)
+            last_velocity = velocity
                 
         
-        logging.debug('driving motors to ({:0.4f},{:0.4f})'.format(
-            line[0],line[1],line[2],
-        ))
+        logging.debug('driving motors to (%0.4f,%0.4f,%0.4f)',
+                      line[0], line[1], line[2])
 
-        logging.info("Target position: " + str(line))
+        logging.info("Target position: %s", line)
         yield from mv(mot_x, line[0], mot_y, line[1], mot_z, line[2])
 
-        logging.debug('motors arrived at ({:0.4f},{:0.4f},{:0.4f}'.format(
-            mot_x.user_readback.value,
-            mot_y.user_readback.value,
-            mot_z.user_readback.value,
-        ))
+        # Only read the motors back if the message will be emitted
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('motors arrived at (%0.4f,%0.4f,%0.4f)',
+                          mot_x.user_readback.value,
+                          mot_y.user_readback.value,
+                          mot_z.user_readback.value)
 
     # Insert shutter - MAYBE DO EARLY FOR ODD N_STROKES?
     # logging.debug('Inserting shutter')
@@ -312,9 +323,9 @@ def rel_smooth_sweep(mot_x, mot_y, mot_z, shutter, short_edge_end,
     yield from abs_set(shutter, "IN")
     
 
-    end_x = mot_x.get().user_readback
-    end_y = mot_y.get().user_readback
-    end_z = mot_z.get().user_readback
+    end_x = mot_x.user_readback.get()
+    end_y = mot_y.user_readback.get()
+    end_z = mot_z.user_readback.get()
     logging.info('Motors ending at: ({x:0.4f},{y:0.4f},{z:0.4f})'.format(
         x=end_x,
         y=end_y,
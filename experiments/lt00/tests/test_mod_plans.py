@@ -9,6 +9,8 @@ from ophyd.sim import SynAxis
 #from experiments.lu20.plans import rel_smooth_sweep, xy_sequencer
 from experiments.lt00.mod_plans import xyz_sequencer, xyz_velocities
 from experiments.lt00.mod_macros import macro_VT50_smooth_sweep
+from sxr.exceptions import InputError
+
 def test_xyz_sequencer():
     # sequence of tuples
     m = xyz_sequencer(
@@ -58,6 +60,32 @@ def test_xyz_sequencer():
     assert np.all((m - target_result) < .0001) 
     assert np.all((m - target_result) > -.0001)
 
+def test_xyz_sequencer_few_strokes():
+    origin = np.array([0, 0, 1])
+    short_edge_end = np.array([4.0, .4, 5.0])
+    long_edge_end = np.array([.6, 3.0, 1.75])
+
+    m = xyz_sequencer(origin, short_edge_end, long_edge_end, 0)
+    assert m.shape == (1, 3)
+    assert np.allclose(m, [origin])
+
+    m = xyz_sequencer(origin, short_edge_end, long_edge_end, 1)
+    assert m.shape == (3, 3)
+    assert np.allclose(m, [
+        origin,
+        long_edge_end,
+        long_edge_end + short_edge_end - origin,
+    ])
+
+@pytest.mark.parametrize('origin, short_edge_end, long_edge_end', [
+    ((0, 0), (4.0, .4), (.6, 3.0)),
+    ((0, 0, 1), (4.0, .4, 5.0, 1.0), (.6, 3.0, 1.75)),
+    ((0, 0, 1), (4.0, .4, 5.0), [(.6, 3.0, 1.75)]),
+])
+def test_xyz_sequencer_bad_shapes(origin, short_edge_end, long_edge_end):
+    with pytest.raises(InputError):
+        xyz_sequencer(origin, short_edge_end, long_edge_end, 4)
+
 def test_xyz_velocities():
     result_short, result_long = xyz_velocities(
         (0, 0, 1),
@@ -1,24 +1,20 @@
 import logging
 
-from bluesky import RunEngine
 from bluesky.preprocessors import run_wrapper
 
 from experiments.lu20.devices import (shutter, rsxs_sample_x, rsxs_sample_y,
     tst_23)
 from experiments.lu20.plans import rel_smooth_sweep_test, rel_smooth_sweep
-from bluesky.callbacks.best_effort import BestEffortCallback
-from bluesky.utils import ProgressBarManager
+from sxr.macros import get_RE
 
 logger = logging.getLogger(__name__)
 
+
 def macro_sweep_test(target):
     logging.info('macro_sweep_test initiated with target {:0.4f}'.format(
         target
     ))
-    RE = RunEngine({})
-    bec = BestEffortCallback()
-    RE.subscribe(bec)
-    RE.waiting_hook = ProgressBarManager()
+    RE = get_RE()
     RE(run_wrapper(rel_smooth_sweep_test(tst_23,target)))
 
 def macro_RSXS_smooth_sweep(stroke_height, stroke_spacing, n_strokes,
@@ -57,10 +53,7 @@ def macro_RSXS_smooth_sweep(stroke_height, stroke_spacing, n_strokes,
         is only scanned in a single direction.
     """
 
-    RE = RunEngine({})
-    bec = BestEffortCallback()
-    RE.subscribe(bec)
-    RE.waiting_hook = ProgressBarManager()
+    RE = get_RE()
     RE(run_wrapper(rel_smooth_sweep(
         mot_x=rsxs_sample_x,
         mot_y=rsxs_sample_y,
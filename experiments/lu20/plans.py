@@ -3,7 +3,7 @@ import logging
 import time
 import datetime
 
-import pandas as pd
+import numpy as np
 from bluesky.plan_stubs import mv, one_nd_step, abs_set, wait as plan_wait
 from bluesky.plans import scan, inner_product_scan, rel_scan
 from bluesky.preprocessors import stub_wrapper
@@ -69,38 +69,95 @@ def xy_sequencer(start_x, start_y, stroke_height, stroke_spacing, n_strokes,
         The 0th indexed coordinate is the initial position.
 
     """
-    coord_list = []
-    coord_list.append((start_x,start_y))
+    # Keep the current position in locals instead of reading it back from the
+    # end of the list
+    cur_x = start_x
+    cur_y = start_y
+    coord_list = [(cur_x, cur_y)]
+    append = coord_list.append
 
     direction = 1
     for x in range(n_strokes):
         # vertical stroke
-        new_x = coord_list[-1][0]
-        new_y = coord_list[-1][1] + (direction * stroke_height)
-        coord_list.append((new_x,new_y))
-        # flip direction for the next stroke if both directions are used
+        cur_y += direction * stroke_height
+        append((cur_x, cur_y))
         if both_directions:
+            # flip direction for the next stroke if both directions are used
             direction *= -1
-
-        # second vertical stroke if only one direction is allowed
-        if not both_directions:
-            new_x = coord_list[-1][0]
-            new_y = coord_list[-1][1] - (direction * stroke_height)
-            coord_list.append((new_x,new_y))
+        else:
+            # second vertical stroke if only one direction is allowed
+            cur_y -= direction * stroke_height
+            append((cur_x, cur_y))
 
         # horizontal stroke
-        new_x = coord_list[-1][0] + stroke_spacing
-        new_y = coord_list[-1][1]
-        coord_list.append((new_x,new_y))
-        
-    # reset move for next set 
-    new_x = coord_list[0][0] + n_strokes * stroke_spacing
-    new_y = coord_list[0][1]
-    coord_list.append((new_x,new_y))
+        cur_x += stroke_spacing
+        append((cur_x, cur_y))
+
+    # reset move for next set
+    append((start_x + n_strokes * stroke_spacing, start_y))
     
     return coord_list
 
 
+def xy_sequencer_array(start_x, start_y, stroke_height, stroke_spacing,
+            n_strokes, both_directions=True, reset=True):
+    """
+    xy_sequencer_array generates the same path as xy_sequencer but as an (N,2)
+    numpy array, built directly from the stroke pattern instead of point by
+    point.
+
+    Parameters
+    ----------
+    See xy_sequencer.
+
+    reset : bool, optional
+        Defaults to True. If this is False, the final move back to the
+        original y axis position is left off the path.
+
+    Returns
+    -------
+    np.array
+        (N,2) array of the (x,y) coordinates defining the path for the sample.
+        The 0th row is the initial position.
+    """
+    # Each stroke is a vertical and a horizontal move, with an extra return
+    # move if only one direction is allowed
+    per_stroke = 2 if both_directions else 3
+    n_moves = per_stroke * n_strokes
+    coords = np.empty((n_moves + 1 + bool(reset), 2), dtype=np.float64)
+    coords[0] = start_x, start_y
+
+    # View the moves of the strokes as (stroke, move, axis)
+    strokes = coords[1:n_moves + 1].reshape(n_strokes, per_stroke, 2)
+    stroke_x = start_x + np.arange(n_strokes) * stroke_spacing
+    strokes[:, :, 0] = stroke_x[:, np.newaxis]
+    # The horizontal move steps over to the next stroke
+    strokes[:, -1, 0] += stroke_spacing
+    if both_directions:
+        # Every other stroke ends at the far edge
+        far_edge = np.arange(n_strokes) % 2 == 0
+        strokes[:, :, 1] = (start_y + far_edge * stroke_height)[:, np.newaxis]
+    else:
+        strokes[:, 0, 1] = start_y + stroke_height
+        strokes[:, 1:, 1] = start_y
+
+    # reset move for next set
+    if reset:
+        coords[-1] = start_x + n_strokes * stroke_spacing, start_y
+    return coords
+
+
+def _sweep_move(mot_x, mot_y, line):
+    """Moves the sample to a single (x,y) coordinate of the sweep."""
+    logging.debug('driving motors to (%0.4f,%0.4f)', line[0], line[1])
+    yield from mv(mot_x, line[0], mot_y, line[1])
+    # Only read the motors back if the message will be emitted
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug('motors arrived at (%0.4f,%0.4f)',
+                      mot_x.user_readback.value,
+                      mot_y.user_readback.value)
+
+
 def rel_smooth_sweep(mot_x, mot_y, shutter, stroke_height, stroke_spacing,
             n_strokes, both_directions=True):
     """
@@ -152,26 +209,23 @@ def rel_smooth_sweep(mot_x, mot_y, shutter, stroke_height, stroke_spacing,
     n_strokes = {n_strokes}
     both_directions = {both_directions}
     """
-    logging.info(initiate_str.format(
-        mot_x=mot_x,
-        mot_y=mot_y,
-        shutter=shutter,
-        stroke_height=stroke_height,
-        stroke_spacing=stroke_spacing,
-        n_strokes=n_strokes,
-        both_directions=both_directions,
-    ))
-
-    logging.info('Start time: {}'.format(datetime.datetime.now().strftime(
-        "%Y/%m/%d %H:%M:%S"
-    )))
+    # Only build the messages if they will be emitted
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(initiate_str.format(
+            mot_x=mot_x,
+            mot_y=mot_y,
+            shutter=shutter,
+            stroke_height=stroke_height,
+            stroke_spacing=stroke_spacing,
+            n_strokes=n_strokes,
+            both_directions=both_directions,
+        ))
+        logging.info('Start time: %s', datetime.datetime.now().strftime(
+            "%Y/%m/%d %H:%M:%S"))
  
-    start_x = mot_x.get().user_readback
-    start_y = mot_y.get().user_readback
-    logging.info('Motors starting at: ({x:0.4f},{y:0.4f})'.format(
-        x=start_x,
-        y=start_y
-    ))
+    start_x = mot_x.user_readback.get()
+    start_y = mot_y.user_readback.get()
+    logging.info('Motors starting at: (%0.4f,%0.4f)', start_x, start_y)
 
     coord_list = xy_sequencer(
         start_x, 
@@ -181,38 +235,33 @@ def rel_smooth_sweep(mot_x, mot_y, shutter, stroke_height, stroke_spacing,
         n_strokes, 
         both_directions
     )
-    logging.debug('Target coordinate list: {}'.format(coord_list))
+    logging.debug('Target coordinate list: %s', coord_list)
 
     logging.debug('Removing shutter')
     shutter.remove()
     
-    for line_no, line in enumerate(coord_list):
-        if not both_directions:
-            if line_no % 3 == 0:
+    if both_directions:
+        for line in coord_list:
+            yield from _sweep_move(mot_x, mot_y, line)
+    else:
+        # The comb path repeats every three moves, toggle the shutter at the
+        # same points of each repetition
+        for line_no, line in enumerate(coord_list):
+            stroke_move = line_no % 3
+            if stroke_move == 0:
                 logging.debug('Removing shutter')
                 shutter.remove()
-            if line_no % 3 == 2:
+            elif stroke_move == 2:
                 logging.debug('Inserting shutter')
                 shutter.insert()
-        
-        logging.debug('driving motors to ({:0.4f},{:0.4f})'.format(
-            line[0],line[1]
-        ))
-        yield from mv(mot_x, line[0], mot_y, line[1])
-        logging.debug('motors arrived at ({:0.4f},{:0.4f})'.format(
-            mot_x.user_readback.value,
-            mot_y.user_readback.value
-        ))
+            yield from _sweep_move(mot_x, mot_y, line)
 
     logging.debug('Inserting shutter')
     shutter.insert()
 
-    end_x = mot_x.get().user_readback
-    end_y = mot_y.get().user_readback
-    logging.info('Motors ending at: ({x:0.4f},{y:0.4f})'.format(
-        x=end_x,
-        y=end_y
-    ))
-    logging.info('End time: {}'.format(datetime.datetime.now().strftime(
-        "%Y/%m/%d %H:%M:%S"
-    )))
+    end_x = mot_x.user_readback.get()
+    end_y = mot_y.user_readback.get()
+    logging.info('Motors ending at: (%0.4f,%0.4f)', end_x, end_y)
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info('End time: %s', datetime.datetime.now().strftime(
+            "%Y/%m/%d %H:%M:%S"))
@@ -1,10 +1,12 @@
+import numpy as np
 import pytest
 
 from bluesky import RunEngine
 from bluesky.preprocessors import run_wrapper
 from ophyd.sim import SynAxis
 
-from experiments.lu20.plans import rel_smooth_sweep, xy_sequencer
+from experiments.lu20.plans import (rel_smooth_sweep, xy_sequencer,
+                                    xy_sequencer_array)
 
 def test_xy_sequencer():
     result = xy_sequencer(0, 0, 3, 1, 4, True)
@@ -40,5 +42,18 @@ def test_xy_sequencer():
     ]
 
 
+@pytest.mark.parametrize('both_directions', [True, False])
+@pytest.mark.parametrize('n_strokes', [1, 4, 5])
+def test_xy_sequencer_array(both_directions, n_strokes):
+    expected = np.array(xy_sequencer(0.5, -1, 3, 1.5, n_strokes,
+                                     both_directions))
+    result = xy_sequencer_array(0.5, -1, 3, 1.5, n_strokes, both_directions)
+    assert np.allclose(result, expected)
+    # Without the reset, the path stops before the final move
+    result = xy_sequencer_array(0.5, -1, 3, 1.5, n_strokes, both_directions,
+                                reset=False)
+    assert np.allclose(result, expected[:-1])
+
+
 def test_rel_smooth_sweep():
     RE = RunEngine({})
@@ -9,7 +9,7 @@ import pytest
 if __name__ == '__main__':
     # Show output results from every test function
     # Show the message output for skipped and expected failures
-    args = ['-v', '-vrxs','--ignore=experiments/lr5816']
+    args = ['-v', '-vrxs']
 
     # Add extra arguments
     if len(sys.argv) > 1:
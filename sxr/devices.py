@@ -1,6 +1,5 @@
 import logging
 import numpy as np
-import time
 from pathlib import Path
 
 import json
@@ -65,18 +64,53 @@ class Vitara(Device, FltMvInterface):
     _offset = Cpt(EpicsSignal, ":FS_TGT_TIME_OFFSET", name="Offset")
     _time = Cpt(EpicsSignal, ":FS_TGT_TIME", name="Timing")
 
-    def set(self, value, *args, **kwargs):
-        return self.move(value, *args, **kwargs)
+    def __init__(self, prefix, *args, **kwargs):
+        super().__init__(prefix, *args, **kwargs)
+        # Keep the latest monitor updates so the readbacks don't have to make a
+        # CA round-trip on every access
+        self._cached_target = None
+        self._cached_offset = None
+        self._cached_time = None
+        self._target.subscribe(self._on_target,
+                               event_type=self._target.SUB_VALUE, run=True)
+        self._offset.subscribe(self._on_offset,
+                               event_type=self._offset.SUB_VALUE, run=True)
+        self._time.subscribe(self._on_time,
+                             event_type=self._time.SUB_VALUE, run=True)
+        # Drop the cached values when the signals disconnect, so the readbacks
+        # fail like the signals do instead of returning stale values
+        for signal in (self._target, self._offset, self._time):
+            signal.subscribe(self._on_meta, event_type=signal.SUB_META,
+                             run=False)
+
+    def _on_target(self, value=None, **kwargs):
+        self._cached_target = value
+
+    def _on_offset(self, value=None, **kwargs):
+        self._cached_offset = value
+
+    def _on_time(self, value=None, **kwargs):
+        self._cached_time = value
+
+    def _on_meta(self, connected=True, **kwargs):
+        if not connected:
+            self._cached_target = None
+            self._cached_offset = None
+            self._cached_time = None
 
-    def move(self, value, *args, **kwargs):
+    def set(self, value, *args, **kwargs):
         return self._time.set(value, *args, **kwargs)
 
+    move = set
+
     @property
     def position(self):
         return self.time
 
     @property
     def target(self):
+        if self._cached_target is not None:
+            return self._cached_target
         return self._target.get()
 
     @target.setter
@@ -85,6 +119,8 @@ class Vitara(Device, FltMvInterface):
 
     @property
     def offset(self):
+        if self._cached_offset is not None:
+            return self._cached_offset
         return self._offset.get()
 
     @offset.setter
@@ -93,6 +129,8 @@ class Vitara(Device, FltMvInterface):
 
     @property
     def time(self):
+        if self._cached_time is not None:
+            return self._cached_time
         return self._time.get()
 
     @time.setter
@@ -161,15 +199,27 @@ class Sequencer(Device):
         self._beam_owner_prefix = "ECS:SYS0:0"
         super().__init__(prefix, *args, **kwargs)
         self.timeout = timeout
-        self._cb_sleep = 0.0125
+        # Bind the methods used on every start and stop
+        self._state_put = self.state_control.put
+        self._status_wait = status_wait
 
     def set(self, value, *args, **kwargs):
-        """Set the sequencer start PV to the inputted value."""
-        def cb(*args, **kwargs):
-            time.sleep(self._cb_sleep)
-            return self.play_status.get() == 0
-        self.state_control.put(value)
-        return SubscriptionStatus(self.play_status, cb)
+        """Set the sequencer start PV to the inputted value.
+
+        The returned status completes once the play status shows the
+        sequencer playing (1) or stopped (0), and fails if that doesn't
+        happen within the timeout.
+        """
+        playing = bool(value)
+        def cb(value=None, **kwargs):
+            # Use the monitored value instead of making another CA request
+            return (value != 0) == playing
+        # Subscribe before the put so no update is missed. The current state
+        # is checked as well, so a sequencer that is already playing or
+        # stopped completes right away
+        status = SubscriptionStatus(self.play_status, cb, timeout=self.timeout)
+        self._state_put(value)
+        return status
 
     def start(self, wait=False):
         """
@@ -193,7 +243,7 @@ class Sequencer(Device):
         """Wait for the inputted status to complete."""
         try:
             status = status or self.status
-            status_wait(status)
+            self._status_wait(status)
         except KeyboardInterrupt:
             pass
             
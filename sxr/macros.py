@@ -0,0 +1,31 @@
+import logging
+
+from bluesky import RunEngine
+from bluesky.callbacks.best_effort import BestEffortCallback
+from bluesky.utils import ProgressBarManager
+
+logger = logging.getLogger(__name__)
+
+# RunEngine shared by the experiment macros, created on first use
+_RE = None
+
+
+def get_RE():
+    """
+    Returns the RunEngine used by the experiment macros, creating it if
+    necessary.
+
+    A macro interrupted with Ctrl-C leaves the RunEngine paused, which would
+    make every following macro fail, so the interrupted plan is aborted
+    before the RunEngine is handed out again.
+    """
+    global _RE
+    if _RE is None:
+        _RE = RunEngine({})
+        _RE.subscribe(BestEffortCallback())
+        _RE.waiting_hook = ProgressBarManager()
+    elif _RE.state != 'idle':
+        logger.warning("Aborting the interrupted plan left in the %s "
+                       "RunEngine", _RE.state)
+        _RE.abort()
+    return _RE
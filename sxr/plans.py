@@ -2,7 +2,6 @@ import uuid
 import logging
 import time
 
-import pandas as pd
 from bluesky.plan_stubs import one_nd_step, abs_set, wait as plan_wait
 from bluesky.plans import scan, inner_product_scan
 from bluesky.preprocessors import stub_wrapper
@@ -0,0 +1,78 @@
+import logging
+
+import pytest
+from ophyd.sim import make_fake_device
+from ophyd.status import wait as status_wait
+
+from ..devices import Sequencer, Vitara
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope='function')
+def vitara():
+    """Simulated vitara."""
+    FakeVitara = make_fake_device(Vitara)
+    return FakeVitara('LAS:FS2:VIT', name='Test Vitara')
+
+
+@pytest.fixture(scope='function')
+def sequencer():
+    """Stopped simulated sequencer."""
+    FakeSequencer = make_fake_device(Sequencer)
+    sequencer = FakeSequencer('ECS:SYS0:2', name='Test Sequencer', timeout=1)
+    sequencer.play_status.sim_put(0)
+    return sequencer
+
+
+def test_sequencer_start(sequencer):
+    status = sequencer.start()
+    assert sequencer.state_control.get() == 1
+    # The stale stopped state doesn't complete the start
+    assert not status.done
+    sequencer.play_status.sim_put(2)
+    status_wait(status, timeout=1)
+    assert status.success
+    # Starting a playing sequencer completes right away
+    status = sequencer.start()
+    status_wait(status, timeout=1)
+    assert status.success
+
+
+def test_sequencer_stop(sequencer):
+    sequencer.play_status.sim_put(2)
+    status = sequencer.stop()
+    assert sequencer.state_control.get() == 0
+    assert not status.done
+    sequencer.play_status.sim_put(0)
+    status_wait(status, timeout=1)
+    assert status.success
+    # Stopping a stopped sequencer completes right away
+    status = sequencer.stop()
+    status_wait(status, timeout=1)
+    assert status.success
+
+
+def test_sequencer_start_times_out(sequencer):
+    sequencer.timeout = 0.1
+    status = sequencer.start()
+    # The sequencer never reports playing
+    with pytest.raises(Exception):
+        status_wait(status, timeout=1)
+    assert status.done and not status.success
+
+
+@pytest.mark.parametrize('attr, signal', [('target', '_target'),
+                                          ('offset', '_offset'),
+                                          ('time', '_time')])
+def test_vitara_cache(vitara, monkeypatch, attr, signal):
+    signal = getattr(vitara, signal)
+    signal.sim_put(3.5)
+    # Readbacks come from the monitored value, not a new get
+    monkeypatch.setattr(signal, 'get', lambda *args, **kwargs: -1.0)
+    assert getattr(vitara, attr) == 3.5
+    signal.sim_put(4.5)
+    assert getattr(vitara, attr) == 4.5
+    # Once disconnected, the readbacks go back to the signal
+    signal._run_subs(sub_type=signal.SUB_META, connected=False)
+    assert getattr(vitara, attr) == -1.0
@@ -10,6 +10,13 @@
 from experiments.lt00.mod_macros import * 
 import subprocess
 
+# The macros only create their devices when they first need them, so
+# create the ones used interactively in this session here
+shutter = get_device('shutter')
+sample_x = get_device('sample_x')
+sample_y = get_device('sample_y')
+sample_z = get_device('sample_z')
+
 def caput(pv,value):
 	
 	myString = subprocess.check_output(["caput",pv,str(value)])